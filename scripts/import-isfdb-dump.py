@@ -11,6 +11,7 @@ Arguments:
     isfdb_db_or_dump   Path to ISFDB SQLite DB (/tmp/isfdb.db) or MySQL dump file.
                        If a .db file is given, queries it directly (fast, <1s).
                        If a dump file is given, parses it line-by-line (slow, ~90s).
+                       A gzipped dump (.gz) is decompressed on the fly.
 
 Options:
     --genre=GENRE      Set genre on all imported series (e.g. litrpg, fantasy, post-apocalyptic)
@@ -39,15 +40,30 @@ Example:
 
     # Slow (direct dump parsing, no loader needed):
     python3 scripts/import-isfdb-dump.py /tmp/isfdb-backup/.../backup-MySQL-55-2026-02-14 --genre=litrpg "Cradle"
+
+    # The script is pure standard library and also runs under PyPy, whose JIT
+    # speeds up the pure-Python parts (dump parsing, book assembly):
+    pypy3 scripts/import-isfdb-dump.py /tmp/isfdb.db --genre=litrpg "Cradle"
 """
 
+import os
 import sys
+import argparse
 import re
+import gzip
+import io
+import mmap
 import sqlite3
 import uuid
 import json
-from datetime import datetime, timezone
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional, Union
 
 # ── Configuration ──────────────────────────────────────────────────────────
 
@@ -59,6 +75,10 @@ INCLUDED_TITLE_TYPES = {'NOVEL', 'NOVELLA', 'SHORTFICTION'}
 # ISFDB language ID for English (filter out translations)
 ENGLISH_LANG_ID = 17
 
+# Both are constant, so find_titles_for_series has them inlined into its SQL as
+# literals rather than bound as parameters on every call
+_INCLUDED_TYPES_SQL = ', '.join(f"'{t}'" for t in sorted(INCLUDED_TITLE_TYPES))
+
 # Titles matching any of these patterns are excluded.
 # ISFDB includes excerpts, appendices, deleted scenes, system entries, etc.
 # that aren't standalone books readers would expect in a series listing.
@@ -80,29 +100,55 @@ EXCLUDED_TITLE_PATTERNS = [
     re.compile(r'^Edits:', re.IGNORECASE),                   # "Edits: Sixth of the Dusk"
 ]
 
+# The above as two alternations, so each title is scanned at most once: the
+# ^-anchored patterns (anchor stripped) are tried with match() at the start of
+# the title only, the rest with search()
+_EXCLUDED_PREFIX_RE = re.compile(
+    '|'.join(f'(?:{p.pattern[1:]})' for p in EXCLUDED_TITLE_PATTERNS if p.pattern.startswith('^')),
+    re.IGNORECASE)
+_EXCLUDED_ANYWHERE_RE = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in EXCLUDED_TITLE_PATTERNS if not p.pattern.startswith('^')),
+    re.IGNORECASE)
+
 
 def is_excluded_title(title):
     """Check if a title matches any exclusion pattern."""
     if not title:
         return True
-    return any(p.search(title) for p in EXCLUDED_TITLE_PATTERNS)
+    return (_EXCLUDED_PREFIX_RE.match(title) is not None
+            or _EXCLUDED_ANYWHERE_RE.search(title) is not None)
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=65536)
 def normalize(text):
     """Normalize a string for matching — must match NachoSeries normalizeText().
     Logic: lowercase, remove non-word/non-space chars, collapse whitespace, trim."""
     if not text:
         return ''
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return _WS_RE.sub(' ', _NONWORD_RE.sub('', text.lower())).strip()
+
 
+def is_sqlite_db(path):
+    """True if `path` is a SQLite database: by extension, else by its 16-byte header."""
+    if path.endswith(('.db', '.sqlite')):
+        return True
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 16).startswith(b'SQLite format 3')
+    finally:
+        os.close(fd)
 
+
+@lru_cache(maxsize=4096)
 def extract_year(date_str):
-    """Extract year from ISFDB date string (YYYY-MM-DD or YYYY-00-00)."""
+    """Extract year from ISFDB date string (YYYY-MM-DD or YYYY-00-00).
+    Cached: titles in a series share a handful of distinct dates."""
     if not date_str:
         return None
     try:
@@ -112,54 +158,155 @@ def extract_year(date_str):
         return None
 
 
+_PTYPE_RANK = {'tp': 2, 'hc': 2, 'ebook': 1}
+
+
+def pub_sort_key(p):
+    """Rank a pub for picking a title's representative edition: prefer ISBN, then tp/hc, then ebook."""
+    has_isbn = 1 if p['pub_isbn'] else 0
+    return (has_isbn, _PTYPE_RANK.get(p.get('pub_ptype'), 0))
+
+
+# pub_sort_key as SQL: one row per title in _ids, its best-ranked pub
+_BEST_PUB_SQL = """
+    SELECT title_id, pub_id, pub_title, pub_year, pub_pages, pub_ptype,
+           pub_ctype, pub_isbn, pub_frontimage, pub_price
+    FROM (
+        SELECT pc.title_id, p.pub_id, p.pub_title, p.pub_year, p.pub_pages, p.pub_ptype,
+               p.pub_ctype, p.pub_isbn, p.pub_frontimage, p.pub_price,
+               ROW_NUMBER() OVER (
+                   PARTITION BY pc.title_id
+                   ORDER BY COALESCE(p.pub_isbn, '') != '' DESC,
+                            CASE p.pub_ptype {} ELSE 0 END DESC,
+                            p.pub_id
+               ) AS rn
+        FROM _ids i CROSS JOIN pub_content pc ON pc.title_id = i.id
+        JOIN pubs p ON p.pub_id = pc.pub_id
+    )
+    WHERE rn = 1
+""".format(' '.join(f"WHEN '{ptype}' THEN {rank}" for ptype, rank in _PTYPE_RANK.items()))
+
+
+@dataclass
+class Book:
+    """One book of an assembled series entry (built by run_import)."""
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10.
+    # sort_key is a plain slot, not a field: parsed once in __post_init__ so
+    # sorting compares ready-made tuples (see book_sort_key)
+    __slots__ = ('title', 'position', 'author', 'year', 'isbn', 'cover_url', 'pages',
+                 'isfdb_title_id', 'sort_key')
+    title: str
+    position: Union[str, float, None]  # ISFDB seriesnum; float once offset by --merge-children
+    author: str
+    year: Optional[int]
+    isbn: Optional[str]
+    cover_url: Optional[str]
+    pages: Optional[str]
+    isfdb_title_id: int
+
+    def __post_init__(self):
+        self.sort_key = book_sort_key(self.position, self.year)
+
+
+_BOOK_JSON_FIELDS = tuple(f.name for f in fields(Book))
+
+
+def json_default(o):
+    """json.dumps hook for series entries: Books become plain dicts, anything else str()."""
+    if isinstance(o, Book):
+        return {name: getattr(o, name) for name in _BOOK_JSON_FIELDS}
+    return str(o)
+
+
+# One shared encoder: json.dumps(default=...) builds a fresh JSONEncoder per call
+encode_entry = json.JSONEncoder(default=json_default).encode
+
+
+def book_sort_key(position, year):
+    """Order books by series position, then year; unnumbered/undated books sort last."""
+    try:
+        pos = float(position) if position is not None else 999
+    except (ValueError, TypeError):
+        pos = 999
+    return (pos, year or 9999)
+
+
 # ══════════════════════════════════════════════════════════════════════════
 # SQLite-based queries (fast path — used when given a .db file)
 # ══════════════════════════════════════════════════════════════════════════
 
 class ISFDBSqlite:
-    """Query ISFDB data from the pre-loaded SQLite database."""
+    """Query ISFDB data from the pre-loaded SQLite database.
+
+    Lookups run on one read-only connection, except the publication lookup:
+    once run_import knows the title IDs, prefetch_pubs() starts it on a second
+    connection in a worker thread, overlapping the author lookup (the only
+    steps that don't depend on each other's results)."""
 
     def __init__(self, db_path):
-        self.db = sqlite3.connect(db_path)
-        self.db.row_factory = sqlite3.Row
+        # The loader writes this DB once; open it read-only and immutable so
+        # SQLite skips locking and journal checks, and read it through mmap.
+        self.uri = Path(db_path).resolve().as_uri() + '?mode=ro&immutable=1'
+        self.db = self._connect()
+        self._pub_reader = None   # second connection for prefetch_pubs
+        self._executor = None
+        self._pending_pubs = None  # (title_ids, Future)
+
+    def _connect(self):
+        # Read-side tuning only. journal_mode/synchronous are left alone: they
+        # govern writes, and this connection is read-only (immutable, no locks).
+        db = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        db.execute("PRAGMA mmap_size=1099511627776")  # capped at SQLite's compile-time max
+        db.execute("PRAGMA cache_size=-262144")  # 256MB cache
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute("CREATE TEMP TABLE IF NOT EXISTS _ids (id INTEGER PRIMARY KEY)")
+        return db
 
     def close(self):
+        if self._executor:
+            self._executor.shutdown()
+        if self._pub_reader:
+            self._pub_reader.close()
         self.db.close()
 
+    def _fill_ids(self, ids, db=None):
+        """Load `ids` into the temp table _ids so a query can JOIN against it
+        in one statement instead of binding batches of placeholders.
+        Queries use `_ids CROSS JOIN <table>`, which pins _ids as the outer loop
+        so SQLite probes the table's index per ID instead of scanning it."""
+        db = db or self.db
+        db.execute("DELETE FROM _ids")
+        db.executemany("INSERT OR IGNORE INTO _ids VALUES (?)", ((i,) for i in ids))
+        db.commit()
+
     def find_series_ids(self, target_names):
         """Find ISFDB series IDs for the given series names.
-        Handles batching automatically for >900 names (SQLite variable limit)."""
+        The lowercased names are bound as one JSON array, so any number of
+        names is matched in a single query (no SQLite variable limit)."""
         target_lower = {name.lower(): name for name in target_names}
         found = {}
 
         print(f"\n🔍 Searching for {len(target_names)} series in ISFDB database...")
 
-        # Batch to stay under SQLite's 999 variable limit
-        name_list = list(target_names)
-        for i in range(0, len(name_list), 900):
-            batch = name_list[i:i+900]
-            placeholders = ','.join(['?'] * len(batch))
-            lower_names = [n.lower() for n in batch]
-            rows = self.db.execute(
-                f"SELECT * FROM series WHERE LOWER(series_title) IN ({placeholders})",
-                lower_names
-            ).fetchall()
-
-            for row in rows:
-                title = row['series_title']
-                if title and title.lower() in target_lower:
-                    orig = target_lower[title.lower()]
-                    found[orig] = {
-                        'series_id': row['series_id'],
-                        'series_title': row['series_title'],
-                        'series_parent': row['series_parent'],
-                        'series_type': row['series_type'],
-                        'series_parent_position': row['series_parent_position'],
-                        'series_note_id': row['series_note_id'],
-                    }
-
-            if len(name_list) > 900 and (i + 900) < len(name_list):
-                print(f"   Batch {i//900 + 1}: matched {len(found)} so far...")
+        rows = self.db.execute(
+            """SELECT series_id, series_title, series_parent, series_type,
+                    series_parent_position, series_note_id
+                FROM series WHERE LOWER(series_title) IN (SELECT value FROM json_each(?))
+                ORDER BY series_id""",
+            (json.dumps(list(target_lower)),)
+        )
+
+        for sid, title, parent, stype, parent_pos, note_id in rows:
+            if title and title.lower() in target_lower:
+                orig = target_lower[title.lower()]
+                found[orig] = {
+                    'series_id': sid,
+                    'series_title': title,
+                    'series_parent': parent,
+                    'series_type': stype,
+                    'series_parent_position': parent_pos,
+                    'series_note_id': note_id,
+                }
 
         return found
 
@@ -169,208 +316,185 @@ class ISFDBSqlite:
         if not parent_ids:
             return parents
 
-        placeholders = ','.join(['?'] * len(parent_ids))
+        self._fill_ids(parent_ids)
         rows = self.db.execute(
-            f"SELECT * FROM series WHERE series_id IN ({placeholders})",
-            list(parent_ids)
-        ).fetchall()
-
-        for row in rows:
-            parents[row['series_id']] = {
-                'series_id': row['series_id'],
-                'series_title': row['series_title'],
-                'series_parent': row['series_parent'],
+            """SELECT s.series_id, s.series_title, s.series_parent
+               FROM _ids i CROSS JOIN series s ON s.series_id = i.id"""
+        )
+
+        for sid, title, parent in rows:
+            parents[sid] = {
+                'series_id': sid,
+                'series_title': title,
+                'series_parent': parent,
             }
 
         return parents
 
     def find_sub_series(self, parent_ids):
         """Find all sub-series that have one of the parent_ids as their parent."""
-        sub = {}
+        sub = defaultdict(list)
         if not parent_ids:
             return sub
 
-        placeholders = ','.join(['?'] * len(parent_ids))
+        self._fill_ids(parent_ids)
         rows = self.db.execute(
-            f"SELECT * FROM series WHERE series_parent IN ({placeholders})",
-            list(parent_ids)
-        ).fetchall()
-
-        for row in rows:
-            pid = row['series_parent']
-            if pid not in sub:
-                sub[pid] = []
+            """SELECT s.series_id, s.series_title, s.series_parent, s.series_parent_position
+               FROM _ids i CROSS JOIN series s ON s.series_parent = i.id"""
+        )
+
+        for sid, title, pid, parent_pos in rows:
             sub[pid].append({
-                'series_id': row['series_id'],
-                'series_title': row['series_title'],
-                'series_parent': row['series_parent'],
-                'series_parent_position': row['series_parent_position'],
+                'series_id': sid,
+                'series_title': title,
+                'series_parent': pid,
+                'series_parent_position': parent_pos,
             })
 
         return sub
 
     def find_titles_for_series(self, series_ids):
         """Find all titles belonging to the given series IDs."""
-        titles = {}
+        titles = defaultdict(list)
         title_ids = set()
 
         print(f"\n📚 Searching for titles in {len(series_ids)} series...")
 
-        placeholders = ','.join(['?'] * len(series_ids))
-        type_placeholders = ','.join(['?'] * len(INCLUDED_TITLE_TYPES))
+        self._fill_ids(series_ids)
         rows = self.db.execute(
-            f"""SELECT * FROM titles 
-                WHERE series_id IN ({placeholders}) 
-                AND title_ttype IN ({type_placeholders})
-                AND (title_parent = 0 OR title_parent IS NULL)
-                AND title_language = ?""",
-            list(series_ids) + list(INCLUDED_TITLE_TYPES) + [ENGLISH_LANG_ID]
-        ).fetchall()
+            f"""SELECT t.title_id, t.title_title, t.series_id, t.title_seriesnum,
+                    t.title_copyright, t.title_ttype
+                FROM _ids i
+                CROSS JOIN titles t ON t.series_id = i.id
+                WHERE t.title_ttype IN ({_INCLUDED_TYPES_SQL})
+                AND (t.title_parent = 0 OR t.title_parent IS NULL)
+                AND t.title_language = {ENGLISH_LANG_ID}
+                ORDER BY i.id, t.title_id"""
+        )
 
         excluded = 0
-        for row in rows:
-            title_text = row['title_title']
+        for tid, title_text, sid, seriesnum, copyright, ttype in rows:
             if is_excluded_title(title_text):
                 excluded += 1
                 continue
-            sid = row['series_id']
-            if sid not in titles:
-                titles[sid] = []
             titles[sid].append({
-                'title_id': row['title_id'],
+                'title_id': tid,
                 'title': title_text,
                 'series_id': sid,
-                'seriesnum': row['title_seriesnum'],
-                'copyright': row['title_copyright'],
-                'ttype': row['title_ttype'],
+                'seriesnum': seriesnum,
+                'copyright': copyright,
+                'ttype': ttype,
             })
-            title_ids.add(row['title_id'])
+            title_ids.add(tid)
 
         if excluded:
             print(f"   Excluded {excluded} non-book titles (excerpts, appendices, etc.)")
         return titles, title_ids
 
-    def find_authors_for_titles(self, title_ids):
-        """Find author IDs for the given title IDs."""
-        title_to_author = {}
-        needed_author_ids = set()
-
-        print(f"\n👤 Searching for authors of {len(title_ids)} titles...")
-
-        title_list = list(title_ids)
-        for i in range(0, len(title_list), 900):
-            batch = title_list[i:i+900]
-            placeholders = ','.join(['?'] * len(batch))
-            rows = self.db.execute(
-                f"SELECT title_id, author_id FROM canonical_author WHERE title_id IN ({placeholders})",
-                batch
-            ).fetchall()
-
-            for row in rows:
-                title_to_author[row['title_id']] = row['author_id']
-                needed_author_ids.add(row['author_id'])
-
-        return title_to_author, needed_author_ids
-
-    def find_author_names(self, author_ids):
-        """Find author canonical names for the given author IDs."""
+    def find_authors_by_title(self, title_ids):
+        """Find each title's canonical author name with one joined query.
+        Titles whose author has no authors row map to 'Unknown'."""
         authors = {}
-        if not author_ids:
-            return authors
-
-        print(f"\n📝 Looking up {len(author_ids)} author names...")
+        author_ids = set()
 
-        author_list = list(author_ids)
-        for i in range(0, len(author_list), 900):
-            batch = author_list[i:i+900]
-            placeholders = ','.join(['?'] * len(batch))
-            rows = self.db.execute(
-                f"SELECT author_id, author_canonical FROM authors WHERE author_id IN ({placeholders})",
-                batch
-            ).fetchall()
+        print(f"\n👤 Searching for authors of {len(title_ids)} titles...")
 
-            for row in rows:
-                authors[row['author_id']] = row['author_canonical']
+        self._fill_ids(title_ids)
+        rows = self.db.execute(
+            """SELECT ca.title_id, a.author_id, a.author_canonical
+               FROM _ids i
+               CROSS JOIN canonical_author ca ON ca.title_id = i.id
+               LEFT JOIN authors a ON a.author_id = ca.author_id"""
+        )
+
+        for tid, aid, name in rows:
+            if aid is None:
+                authors[tid] = 'Unknown'
+            else:
+                authors[tid] = name
+                author_ids.add(aid)
 
+        print(f"   Found {len(author_ids)} unique authors")
         return authors
 
+    def prefetch_titles(self, target_names):
+        """Nothing to read ahead: series and titles are indexed lookups."""
+
+    def prefetch_pubs(self, title_ids):
+        """Start the publication lookup for `title_ids` on a second read-only
+        connection in a worker thread, so it overlaps the author lookup.
+        find_pubs_for_titles picks up the result. sqlite3 releases the GIL
+        while SQLite runs a query, so the two lookups really run concurrently."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_pubs = (title_ids, self._executor.submit(self._prefetched_pubs, title_ids))
+
+    def _prefetched_pubs(self, title_ids):
+        # Runs on the worker; the reader connection is opened here on first use
+        # so its setup overlaps the main thread's work too
+        if self._pub_reader is None:
+            self._pub_reader = self._connect()
+        return self._query_pubs(self._pub_reader, title_ids)
+
     def find_pubs_for_titles(self, title_ids):
         """Find publications (ISBNs, covers) for the given titles."""
         print(f"\n📖 Finding publications for {len(title_ids)} titles...")
 
-        title_to_pubs = {}
-        pub_ids = set()
-        title_list = list(title_ids)
-
-        for i in range(0, len(title_list), 900):
-            batch = title_list[i:i+900]
-            placeholders = ','.join(['?'] * len(batch))
-            rows = self.db.execute(
-                f"SELECT title_id, pub_id FROM pub_content WHERE title_id IN ({placeholders})",
-                batch
-            ).fetchall()
-
-            for row in rows:
-                tid = row['title_id']
-                pid = row['pub_id']
-                if tid not in title_to_pubs:
-                    title_to_pubs[tid] = set()
-                title_to_pubs[tid].add(pid)
-                pub_ids.add(pid)
-
-        print(f"   Found {len(pub_ids)} publication records linked to our titles")
+        pending, self._pending_pubs = self._pending_pubs, None
+        if pending and pending[0] == title_ids:
+            pub_count, title_pub_info = pending[1].result()
+        else:
+            pub_count, title_pub_info = self._query_pubs(self.db, title_ids)
 
-        pubs = {}
-        pub_list = list(pub_ids)
-
-        for i in range(0, len(pub_list), 900):
-            batch = pub_list[i:i+900]
-            placeholders = ','.join(['?'] * len(batch))
-            rows = self.db.execute(
-                f"SELECT * FROM pubs WHERE pub_id IN ({placeholders})",
-                batch
-            ).fetchall()
-
-            for row in rows:
-                pubs[row['pub_id']] = {
-                    'pub_id': row['pub_id'],
-                    'pub_title': row['pub_title'],
-                    'pub_year': row['pub_year'],
-                    'pub_pages': row['pub_pages'],
-                    'pub_ptype': row['pub_ptype'],
-                    'pub_ctype': row['pub_ctype'],
-                    'pub_isbn': row['pub_isbn'],
-                    'pub_frontimage': row['pub_frontimage'],
-                    'pub_price': row['pub_price'],
-                }
+        print(f"   Found {pub_count} publication records linked to our titles")
+        return title_pub_info
 
-        title_pub_info = {}
-        for tid, pub_id_set in title_to_pubs.items():
-            candidates = [pubs[pid] for pid in pub_id_set if pid in pubs]
-            if not candidates:
-                continue
+    def _query_pubs(self, db, title_ids):
+        """Run the publication queries for find_pubs_for_titles on `db`.
+        Returns (number of linked pubs, title_id -> best pub dict).
+        The best pub per title is picked inside SQLite (same ranking as
+        pub_sort_key, lowest pub_id on ties), so only winning rows are fetched."""
+        self._fill_ids(title_ids, db)
+        (pub_count,) = db.execute(
+            "SELECT COUNT(DISTINCT pc.pub_id) FROM _ids i CROSS JOIN pub_content pc ON pc.title_id = i.id"
+        ).fetchone()
 
-            def pub_sort_key(p):
-                has_isbn = 1 if p['pub_isbn'] else 0
-                ptype = p.get('pub_ptype', '') or ''
-                if ptype in ('tp', 'hc'):
-                    type_rank = 2
-                elif ptype == 'ebook':
-                    type_rank = 1
-                else:
-                    type_rank = 0
-                return (has_isbn, type_rank)
+        rows = db.execute(_BEST_PUB_SQL)
 
-            candidates.sort(key=pub_sort_key, reverse=True)
-            title_pub_info[tid] = candidates[0]
+        title_pub_info = {}
+        for tid, pid, title, year, pages, ptype, ctype, isbn, frontimage, price in rows:
+            title_pub_info[tid] = {
+                'pub_id': pid,
+                'pub_title': title,
+                'pub_year': year,
+                'pub_pages': pages,
+                'pub_ptype': ptype,
+                'pub_ctype': ctype,
+                'pub_isbn': isbn,
+                'pub_frontimage': frontimage,
+                'pub_price': price,
+            }
 
-        return title_pub_info
+        return pub_count, title_pub_info
 
 
 # ══════════════════════════════════════════════════════════════════════════
 # Dump-file-based queries (slow fallback — used when given a raw dump)
 # ══════════════════════════════════════════════════════════════════════════
 
+# Backslash escapes inside quoted MySQL strings (mysqldump writes \0 \' \" \\ \n \r \Z),
+# undone in a single pass. As in MySQL, a backslash before a character with no
+# special meaning just drops out, except in \% and \_, which keep it.
+_ESC_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESC_MAP = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a",
+            "%": "\\%", "_": "\\_"}
+
+
+def _unescape(m):
+    c = m.group(1)
+    return _ESC_MAP.get(c, c)
+
+
 def parse_mysql_value(val_str):
     """Parse a MySQL value from an INSERT statement."""
     val_str = val_str.strip()
@@ -378,11 +502,8 @@ def parse_mysql_value(val_str):
         return None
     if val_str.startswith("'") and val_str.endswith("'"):
         inner = val_str[1:-1]
-        inner = inner.replace("\\'", "'")
-        inner = inner.replace("\\\\", "\\")
-        inner = inner.replace("\\n", "\n")
-        inner = inner.replace("\\r", "\r")
-        inner = inner.replace("\\t", "\t")
+        if '\\' in inner:
+            inner = _ESC_RE.sub(_unescape, inner)
         return inner
     try:
         if '.' in val_str:
@@ -392,9 +513,25 @@ def parse_mysql_value(val_str):
         return val_str
 
 
-def parse_mysql_tuples(line):
-    """Parse MySQL INSERT VALUES into list of tuples."""
-    values_match = re.search(r'VALUES\s+', line, re.IGNORECASE)
+_INSERT_PREFIX = b'INSERT INTO `'
+
+# Read-ahead in front of GzipFile, whose own 8KB buffer would otherwise mean
+# millions of small decompress-and-copy reads over a multi-GB dump
+_GZIP_BUFFER_SIZE = 16 * 1024 * 1024
+
+_VALUES_RE = re.compile(r'VALUES\s+', re.IGNORECASE)
+
+# One value inside a tuple: bare text and quoted strings up to the next unquoted
+# ',' or ')'. Written as an unrolled loop so a truncated line fails in linear time.
+_MYSQL_VALUE_RE = re.compile(
+    r"([^,)']*(?:'[^'\\]*(?:\\.[^'\\]*)*'[^,)']*)*)([,)])", re.DOTALL)
+
+
+def parse_mysql_tuples(line, key_col=None, keys=None):
+    """Parse MySQL INSERT VALUES into list of tuples.
+    If `key_col` is given, only tuples whose value in that column is in `keys`
+    are decoded — the rest are skipped as soon as their key has been checked."""
+    values_match = _VALUES_RE.search(line)
     if not values_match:
         return []
 
@@ -402,235 +539,315 @@ def parse_mysql_tuples(line):
     data = data.rstrip().rstrip(';').rstrip()
 
     tuples = []
-    i = 0
-    while i < len(data):
-        if data[i] == '(':
-            i += 1
-            values = []
-            current = ''
-            in_string = False
-            escape_next = False
-
-            while i < len(data):
-                ch = data[i]
-
-                if escape_next:
-                    current += ch
-                    escape_next = False
-                    i += 1
-                    continue
-
-                if ch == '\\' and in_string:
-                    current += ch
-                    escape_next = True
-                    i += 1
-                    continue
-
-                if ch == "'" and not escape_next:
-                    if in_string:
-                        in_string = False
-                        current += ch
-                    else:
-                        in_string = True
-                        current += ch
-                    i += 1
-                    continue
-
-                if in_string:
-                    current += ch
-                    i += 1
-                    continue
-
-                if ch == ',':
-                    values.append(parse_mysql_value(current))
-                    current = ''
-                    i += 1
-                    continue
-                elif ch == ')':
-                    values.append(parse_mysql_value(current))
-                    tuples.append(values)
-                    i += 1
-                    break
-                else:
-                    current += ch
-                    i += 1
-                    continue
-        else:
-            i += 1
+    match_value = _MYSQL_VALUE_RE.match
+    pos = data.find('(')
+    while pos != -1:
+        raw = []
+        pos += 1
+        while True:
+            m = match_value(data, pos)
+            if not m:
+                return tuples  # Truncated tuple — drop it
+            raw.append(m.group(1))
+            pos = m.end()
+            if m.group(2) == ')':
+                break
+        if key_col is None or (len(raw) > key_col and parse_mysql_value(raw[key_col]) in keys):
+            tuples.append([parse_mysql_value(v) for v in raw])
+        pos = data.find('(', pos)
 
     return tuples
 
 
 class ISFDBDump:
-    """Query ISFDB data by parsing the raw MySQL dump file (slow)."""
+    """Query ISFDB data by parsing the raw MySQL dump file (slow).
+
+    The dump is streamed as few times as possible: run_import reads series and
+    titles together in a first pass (prefetch_titles) and authors and
+    publications in a second. The series table is cached for all series lookups."""
 
     def __init__(self, dump_path):
         self.dump_path = dump_path
+        # ISFDB dumps are distributed gzipped; stream-decompress rather than
+        # requiring an unpacked copy on disk
+        self._gzipped = str(dump_path).endswith('.gz')
+        self._series = None
+        self._titles = None
+        self._details = None
 
     def close(self):
         pass
 
+    def _iter_tables(self, tables):
+        """Stream the dump once, yielding (table, line) for each INSERT into one of `tables`.
+        Lines are read as bytes and only decoded once they are known to be wanted;
+        callers parse them with parse_mysql_tuples, filtering on a key column.
+        mysqldump writes each table's INSERTs as one block, so reading stops at
+        the first other table's INSERT once every wanted table has been seen."""
+        if not tables:
+            return
+        wanted = {name.encode('latin1'): name for name in tables}
+        unseen = set(wanted)
+        for name, line in self._insert_lines(wanted):
+            if line is not None:
+                unseen.discard(name)
+                yield wanted[name], line.decode('latin1')
+            elif not unseen:
+                return
+
+    def _insert_lines(self, wanted):
+        """Yield (table name, line) as bytes for each INSERT line in the dump, with
+        line None unless the table is in `wanted`. An uncompressed dump is
+        memory-mapped and searched for INSERT line starts with mmap.find(), so
+        everything else, including other tables' INSERTs, is skipped without
+        being copied."""
+        if self._gzipped:
+            with open(self.dump_path, 'rb') as raw:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # Closing the reader closes the GzipFile under it
+                with io.BufferedReader(gzip.GzipFile(fileobj=raw), _GZIP_BUFFER_SIZE) as f:
+                    for line in f:
+                        if line.startswith(_INSERT_PREFIX):
+                            name = line[13:line.find(b'`', 13)]
+                            yield name, line if name in wanted else None
+            return
+
+        with open(self.dump_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                find = mm.find
+                needle = b'\n' + _INSERT_PREFIX
+
+                def line_after(pos):
+                    nl = find(needle, pos)
+                    return nl + 1 if nl >= 0 else -1
+
+                start = 0 if mm[:13] == _INSERT_PREFIX else line_after(0)
+                while start >= 0:
+                    name_end = find(b'`', start + 13)
+                    if name_end < 0:
+                        return  # truncated final INSERT line
+                    name = mm[start + 13:name_end]
+                    end = find(b'\n', name_end) + 1 or len(mm)
+                    yield name, mm[start:end] if name in wanted else None
+                    start = line_after(end - 1)
+
+    def _series_rows(self):
+        """All series tuples — read from the dump on first use, then cached."""
+        if self._series is None:
+            self._series = [t for _, line in self._iter_tables({'series'})
+                            for t in parse_mysql_tuples(line) if len(t) >= 6]
+        return self._series
+
+    @staticmethod
+    def _related_series_ids(series_rows, target_names):
+        """IDs of every series run_import can request titles for: the targets
+        and the children of both the targets and their parents."""
+        target_lower = {name.lower() for name in target_names}
+        found = {t[0] for t in series_rows if t[1] and t[1].lower() in target_lower}
+        roots = found | {t[2] for t in series_rows if t[0] in found and t[2]}
+        return found | {t[0] for t in series_rows if t[2] in roots}
+
+    @staticmethod
+    def _title_entry(t):
+        """Title dict for a titles tuple, or None if the title is not a book we import."""
+        if len(t) < 23:
+            return None
+        ttype = t[9]
+        parent = t[12]
+        lang = t[16]
+        if ttype not in INCLUDED_TITLE_TYPES or not (parent == 0 or parent is None):
+            return None
+        if lang is not None and lang != ENGLISH_LANG_ID:
+            return None  # Skip non-English translations
+        title_text = t[1]
+        if is_excluded_title(title_text):
+            return None
+        return {
+            'title_id': t[0], 'title': title_text, 'series_id': t[5],
+            'seriesnum': t[6], 'copyright': t[7], 'ttype': ttype,
+        }
+
+    def prefetch_titles(self, target_names):
+        """Read series and titles in one pass, before run_import asks for either.
+
+        mysqldump writes series before titles, so by the time titles stream past
+        the related series are known and only their rows are decoded; with any
+        other table order titles are kept unfiltered until series is complete."""
+        series_rows = []
+        wanted = None
+        titles = defaultdict(list)
+        for table, line in self._iter_tables({'series', 'titles'}):
+            if table == 'series':
+                series_rows.extend(t for t in parse_mysql_tuples(line) if len(t) >= 6)
+                continue
+            if wanted is None and series_rows:
+                wanted = self._related_series_ids(series_rows, target_names)
+            key_col = 5 if wanted is not None else None
+            for t in parse_mysql_tuples(line, key_col, wanted):
+                entry = self._title_entry(t)
+                if entry:
+                    titles[entry['series_id']].append(entry)
+
+        self._series = series_rows
+        covered = self._related_series_ids(series_rows, target_names)
+        self._titles = (covered, {sid: ts for sid, ts in titles.items() if sid in covered})
+
+    def _title_details(self, title_ids):
+        """Collect authors and publications for `title_ids` in a single pass over
+        canonical_author, authors, pub_content and pubs.
+
+        mysqldump writes each table as one contiguous block, in alphabetical order
+        (authors before canonical_author, pub_content before pubs). Rows of a
+        dependent table are filtered as they stream past once the table holding
+        their IDs is complete, and kept unfiltered otherwise."""
+        if self._details is not None and self._details[0] == title_ids:
+            return self._details[1]
+
+        title_to_author = {}
+        needed_author_ids = set()
+        author_names = {}
+        title_to_pubs = defaultdict(set)
+        pub_ids = set()
+        pubs = {}
+        finished = set()
+        last_table = None
+
+        # No titles means nothing to look up: skip the scan entirely
+        tables = {'canonical_author', 'authors', 'pub_content', 'pubs'} if title_ids else set()
+        for table, line in self._iter_tables(tables):
+            if table != last_table:
+                if last_table:
+                    finished.add(last_table)
+                last_table = table
+
+            if table == 'canonical_author':
+                for t in parse_mysql_tuples(line, 1, title_ids):
+                    if len(t) >= 4:
+                        title_to_author[t[1]] = t[2]
+                        needed_author_ids.add(t[2])
+            elif table == 'authors':
+                key_col = 0 if 'canonical_author' in finished else None
+                for t in parse_mysql_tuples(line, key_col, needed_author_ids):
+                    if len(t) >= 2:
+                        author_names[t[0]] = t[1]
+            elif table == 'pub_content':
+                for t in parse_mysql_tuples(line, 1, title_ids):
+                    if len(t) >= 3:
+                        tid = t[1]
+                        pid = t[2]
+                        title_to_pubs[tid].add(pid)
+                        pub_ids.add(pid)
+            else:
+                key_col = 0 if 'pub_content' in finished else None
+                for t in parse_mysql_tuples(line, key_col, pub_ids):
+                    if len(t) >= 15:
+                        pubs[t[0]] = {
+                            'pub_id': t[0], 'pub_title': t[1], 'pub_year': t[3],
+                            'pub_pages': t[5], 'pub_ptype': t[6], 'pub_ctype': t[7],
+                            'pub_isbn': t[8], 'pub_frontimage': t[9], 'pub_price': t[10],
+                        }
+
+        details = {
+            'title_to_author': title_to_author,
+            'needed_author_ids': needed_author_ids,
+            'author_names': author_names,
+            'title_to_pubs': title_to_pubs,
+            'pub_ids': pub_ids,
+            'pubs': pubs,
+        }
+        self._details = (title_ids, details)
+        return details
+
     def find_series_ids(self, target_names):
         target_lower = {name.lower(): name for name in target_names}
         found = {}
         print(f"\n🔍 Searching for {len(target_names)} series in ISFDB dump (slow)...")
 
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`series`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 6:
-                            series_title = t[1]
-                            if series_title and series_title.lower() in target_lower:
-                                orig = target_lower[series_title.lower()]
-                                found[orig] = {
-                                    'series_id': t[0], 'series_title': t[1],
-                                    'series_parent': t[2], 'series_type': t[3],
-                                    'series_parent_position': t[4], 'series_note_id': t[5],
-                                }
+        for t in self._series_rows():
+            series_title = t[1]
+            if series_title and series_title.lower() in target_lower:
+                orig = target_lower[series_title.lower()]
+                found[orig] = {
+                    'series_id': t[0], 'series_title': t[1],
+                    'series_parent': t[2], 'series_type': t[3],
+                    'series_parent_position': t[4], 'series_note_id': t[5],
+                }
         return found
 
     def find_parent_series(self, parent_ids):
         parents = {}
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`series`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 6 and t[0] in parent_ids:
-                            parents[t[0]] = {
-                                'series_id': t[0], 'series_title': t[1], 'series_parent': t[2],
-                            }
+        for t in self._series_rows():
+            if t[0] in parent_ids:
+                parents[t[0]] = {
+                    'series_id': t[0], 'series_title': t[1], 'series_parent': t[2],
+                }
         return parents
 
     def find_sub_series(self, parent_ids):
-        sub = {}
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`series`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 6 and t[2] in parent_ids:
-                            pid = t[2]
-                            if pid not in sub:
-                                sub[pid] = []
-                            sub[pid].append({
-                                'series_id': t[0], 'series_title': t[1],
-                                'series_parent': t[2], 'series_parent_position': t[4],
-                            })
+        sub = defaultdict(list)
+        for t in self._series_rows():
+            if t[2] in parent_ids:
+                pid = t[2]
+                sub[pid].append({
+                    'series_id': t[0], 'series_title': t[1],
+                    'series_parent': t[2], 'series_parent_position': t[4],
+                })
         return sub
 
     def find_titles_for_series(self, series_ids):
-        titles = {}
+        titles = defaultdict(list)
         title_ids = set()
         print(f"\n📚 Searching for titles in {len(series_ids)} series (slow)...")
 
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`titles`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 23:
-                            sid = t[5]
-                            ttype = t[9]
-                            parent = t[12]
-                            lang = t[16]
-                            if sid in series_ids and ttype in INCLUDED_TITLE_TYPES and (parent == 0 or parent is None):
-                                if lang is not None and lang != ENGLISH_LANG_ID:
-                                    continue  # Skip non-English translations
-                                title_text = t[1]
-                                if is_excluded_title(title_text):
-                                    continue
-                                if sid not in titles:
-                                    titles[sid] = []
-                                titles[sid].append({
-                                    'title_id': t[0], 'title': title_text, 'series_id': sid,
-                                    'seriesnum': t[6], 'copyright': t[7], 'ttype': ttype,
-                                })
-                                title_ids.add(t[0])
+        # Answered from prefetch_titles when it covered every requested series
+        if self._titles is not None and series_ids <= self._titles[0]:
+            for sid, entries in self._titles[1].items():
+                if sid in series_ids:
+                    titles[sid] = list(entries)
+                    title_ids.update(t['title_id'] for t in entries)
+            return titles, title_ids
+
+        for _, line in self._iter_tables({'titles'}):
+            for t in parse_mysql_tuples(line, 5, series_ids):
+                entry = self._title_entry(t)
+                if entry and entry['series_id'] in series_ids:
+                    titles[entry['series_id']].append(entry)
+                    title_ids.add(entry['title_id'])
         return titles, title_ids
 
-    def find_authors_for_titles(self, title_ids):
-        title_to_author = {}
-        needed_author_ids = set()
-        print(f"\n👤 Searching for authors of {len(title_ids)} titles (slow)...")
+    def prefetch_pubs(self, title_ids):
+        """Nothing to start early: _title_details reads pubs in the same pass as authors."""
 
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`canonical_author`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 4 and t[1] in title_ids:
-                            title_to_author[t[1]] = t[2]
-                            needed_author_ids.add(t[2])
-        return title_to_author, needed_author_ids
-
-    def find_author_names(self, author_ids):
-        authors = {}
-        print(f"\n📝 Looking up {len(author_ids)} author names (slow)...")
-
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`authors`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 2 and t[0] in author_ids:
-                            authors[t[0]] = t[1]
+    def find_authors_by_title(self, title_ids):
+        print(f"\n👤 Searching for authors of {len(title_ids)} titles (slow)...")
+        details = self._title_details(title_ids)
+        names = details['author_names']
+        authors = {tid: names.get(aid, 'Unknown') if aid else 'Unknown'
+                   for tid, aid in details['title_to_author'].items()}
+        print(f"   Found {sum(1 for aid in details['needed_author_ids'] if aid in names)} unique authors")
         return authors
 
     def find_pubs_for_titles(self, title_ids):
         print(f"\n📖 Finding publications for {len(title_ids)} titles (slow)...")
 
-        title_to_pubs = {}
-        pub_ids = set()
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`pub_content`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 3 and t[1] in title_ids:
-                            tid = t[1]
-                            pid = t[2]
-                            if tid not in title_to_pubs:
-                                title_to_pubs[tid] = set()
-                            title_to_pubs[tid].add(pid)
-                            pub_ids.add(pid)
-
-        print(f"   Found {len(pub_ids)} publication records linked to our titles")
-
-        pubs = {}
-        with open(self.dump_path, 'r', encoding='latin1') as f:
-            for line in f:
-                if 'INSERT INTO' in line and '`pubs`' in line:
-                    tuples = parse_mysql_tuples(line)
-                    for t in tuples:
-                        if len(t) >= 15 and t[0] in pub_ids:
-                            pubs[t[0]] = {
-                                'pub_id': t[0], 'pub_title': t[1], 'pub_year': t[3],
-                                'pub_pages': t[5], 'pub_ptype': t[6], 'pub_ctype': t[7],
-                                'pub_isbn': t[8], 'pub_frontimage': t[9], 'pub_price': t[10],
-                            }
+        details = self._title_details(title_ids)
+        title_to_pubs = details['title_to_pubs']
+        pubs = details['pubs']
+        print(f"   Found {len(details['pub_ids'])} publication records linked to our titles")
 
         title_pub_info = {}
         for tid, pub_id_set in title_to_pubs.items():
-            candidates = [pubs[pid] for pid in pub_id_set if pid in pubs]
+            # In pub_id order, so ties go to the lowest pub_id as in the SQLite backend
+            candidates = [pubs[pid] for pid in sorted(pub_id_set) if pid in pubs]
             if not candidates:
                 continue
 
-            def pub_sort_key(p):
-                has_isbn = 1 if p['pub_isbn'] else 0
-                ptype = p.get('pub_ptype', '') or ''
-                if ptype in ('tp', 'hc'):
-                    type_rank = 2
-                elif ptype == 'ebook':
-                    type_rank = 1
-                else:
-                    type_rank = 0
-                return (has_isbn, type_rank)
-
-            candidates.sort(key=pub_sort_key, reverse=True)
-            title_pub_info[tid] = candidates[0]
+            title_pub_info[tid] = max(candidates, key=pub_sort_key)
 
         return title_pub_info
 
@@ -639,39 +856,141 @@ class ISFDBDump:
 # Import logic (shared between SQLite and dump backends)
 # ══════════════════════════════════════════════════════════════════════════
 
-def import_to_nachoseries(series_data, dry_run=False, genre=None):
-    """Import the collected series data into NachoSeries SQLite database."""
+# Indexes behind the series lookups by ISFDB ID and normalized name. schema.sql
+# declares them too, but a DB the app hasn't opened since may still lack them.
+SERIES_LOOKUP_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_series_name ON series(name_normalized)",
+    "CREATE INDEX IF NOT EXISTS idx_series_isfdb ON series(isfdb_id)",
+]
+
+
+# Queued import writes are flushed with executemany once any queue reaches this size
+WRITE_BATCH_SIZE = 1000
+
+# Write statements used by the import, kept as module constants so every call
+# passes the same SQL string and hits sqlite3's prepared-statement cache.
+# Timestamps come from SQLite itself (the schema's datetime('now') defaults),
+# the same format the app writes, rather than a bound parameter per row.
+
+# Sets isfdb_id and/or parent_series_id in one statement; None leaves a column as is
+_UPDATE_SERIES_LINKS_SQL = """
+    UPDATE series SET isfdb_id = COALESCE(?, isfdb_id),
+        parent_series_id = COALESCE(?, parent_series_id), updated_at = datetime('now')
+    WHERE id = ?
+"""
+
+_INSERT_SERIES_SQL = """
+    INSERT INTO series (id, name, name_normalized, author, author_normalized,
+        total_books, year_start, year_end, confidence, verified,
+        isfdb_id, genre, parent_series_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_BOOK_SQL = """
+    INSERT INTO series_book (id, series_id, position, title, title_normalized,
+        author, year_published, isbn, confidence)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SOURCE_SQL = """
+    INSERT INTO source_data (id, series_id, source, raw_data, book_count)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def connect_nachoseries(dry_run=False):
+    """Open the NachoSeries DB for an import, in WAL mode like the app itself.
+    A dry run opens it read-only instead, leaving the file (and its journal
+    mode) untouched."""
+    if dry_run:
+        uri = f"{NACHOSERIES_DB.resolve().as_uri()}?mode=ro"
+        db = sqlite3.connect(uri, uri=True, cached_statements=512)
+    else:
+        db = sqlite3.connect(str(NACHOSERIES_DB), cached_statements=512)
+        db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-65536")  # 64MB cache
+    return db
+
+
+def ensure_lookup_indexes(db):
+    """Create SERIES_LOOKUP_INDEXES if missing, before any lookups run."""
+    for idx_sql in SERIES_LOOKUP_INDEXES:
+        db.execute(idx_sql)
+
+
+def prefetch_existing_series(cursor, isfdb_ids, names_normalized):
+    """Fetch the NachoSeries rows matching any of `isfdb_ids` or `names_normalized`
+    in one query. Returns (by_isfdb, by_norm, track): each row is a mutable
+    [id, isfdb_id, parent_series_id] list shared by both indexes, first row (by
+    rowid) winning per key as a `WHERE ... = ?` lookup would. Callers keep the
+    indexes in step with their own writes by updating rows in place and passing
+    new or re-keyed rows to track(row, name_normalized)."""
+    by_isfdb = {}  # isfdb_id -> row
+    by_norm = {}   # name_normalized -> row
+
+    def track(row, name_norm):
+        if row[1]:
+            by_isfdb.setdefault(row[1], row)
+        by_norm.setdefault(name_norm, row)
+
+    cursor.execute("""
+        SELECT id, isfdb_id, parent_series_id, name_normalized FROM series
+        WHERE isfdb_id IN (SELECT value FROM json_each(?))
+           OR name_normalized IN (SELECT value FROM json_each(?))
+        ORDER BY rowid
+    """, (json.dumps(sorted(set(isfdb_ids))), json.dumps(sorted(set(names_normalized)))))
+    for sid, sisfdb, sparent, snorm in cursor:
+        track([sid, sisfdb, sparent], snorm)
+    return by_isfdb, by_norm, track
+
+
+def import_to_nachoseries(series_data, dry_run=False, genre=None, lookup_series=None):
+    """Import the collected series data into NachoSeries SQLite database.
+
+    series_data is iterated once, so it may be a generator. Existing series are
+    prefetched before the first entry is read, from lookup_series: (isfdb_id, title)
+    pairs covering every series an entry or its parent_info can name (extras are
+    harmless). If omitted, series_data is materialized and the pairs taken from it."""
+    if lookup_series is None:
+        series_data = list(series_data)
+        lookup_series = [(e['series_id'], e['series_title']) for e in series_data]
+        lookup_series += [(e['parent_info']['series_id'], e['parent_info']['series_title'])
+                          for e in series_data if e.get('parent_info')]
 
     if dry_run:
         print("\n🔍 DRY RUN — no database changes will be made\n")
     if genre:
         print(f"📎 Genre: {genre}")
 
-    db = sqlite3.connect(str(NACHOSERIES_DB))
-    cursor = db.cursor()
-
-    now = datetime.now(tz=timezone.utc).isoformat()
-    series_inserted = 0
-    series_updated = 0
-    books_inserted = 0
-    source_inserted = 0
-    parent_stub_ids = {}  # isfdb_id -> nachoseries UUID
-
-    for entry in series_data:
-        series_name = entry['series_title']
-        isfdb_id = str(entry['series_id'])
-        books = entry.get('books', [])
-
-        # Determine primary author from books
-        author_counts = {}
-        for b in books:
-            a = b.get('author', '')
-            if a:
-                author_counts[a] = author_counts.get(a, 0) + 1
-        primary_author = max(author_counts, key=author_counts.get) if author_counts else None
+    with closing(connect_nachoseries(dry_run)) as db, db:
+        if not dry_run:
+            ensure_lookup_indexes(db)
+        cursor = db.cursor()
+
+        series_inserted = 0
+        series_updated = 0
+        books_inserted = 0
+        source_inserted = 0
+        parent_stub_ids = {}  # isfdb_id -> nachoseries UUID
+
+        # Prefetch every existing series this import can match (by ISFDB ID or
+        # normalized name, for entries and their parents) in one query. Rows are
+        # mutable [id, isfdb_id, parent_series_id] lists shared by both indexes and
+        # kept in step with the INSERTs/UPDATEs below, so lookups never hit SQL.
+        norm_by_isfdb = {}  # isfdb_id -> normalized title
+        for lookup_id, lookup_title in lookup_series:
+            lookup_id = str(lookup_id)
+            if lookup_id not in norm_by_isfdb:
+                norm_by_isfdb[lookup_id] = normalize(lookup_title)
+        by_isfdb, by_norm, track = prefetch_existing_series(
+            cursor, norm_by_isfdb, norm_by_isfdb.values())
 
         # --- Helper: resolve parent series (create stub if needed) ---
-        def resolve_parent(entry_data):
+        # Defined once, outside the entry loop; a new stub takes the author of the
+        # entry being imported, so primary_author is passed in rather than closed over.
+        def resolve_parent(entry_data, primary_author):
             if not entry_data.get('parent_info'):
                 return None
             parent = entry_data['parent_info']
@@ -680,125 +999,149 @@ def import_to_nachoseries(series_data, dry_run=False, genre=None):
             if parent_isfdb_id in parent_stub_ids:
                 return parent_stub_ids[parent_isfdb_id]
 
-            cursor.execute("SELECT id FROM series WHERE isfdb_id = ?", (parent_isfdb_id,))
-            parent_row = cursor.fetchone()
+            parent_row = by_isfdb.get(parent_isfdb_id)
             if parent_row:
                 parent_stub_ids[parent_isfdb_id] = parent_row[0]
                 return parent_row[0]
 
-            parent_name_norm = normalize(parent['series_title'])
-            cursor.execute("SELECT id, isfdb_id FROM series WHERE name_normalized = ?", (parent_name_norm,))
-            parent_row = cursor.fetchone()
+            parent_name_norm = norm_by_isfdb[parent_isfdb_id]
+            parent_row = by_norm.get(parent_name_norm)
             if parent_row:
                 existing_parent_id = parent_row[0]
                 existing_parent_isfdb = parent_row[1]
                 parent_stub_ids[parent_isfdb_id] = existing_parent_id
                 if not existing_parent_isfdb:
                     if not dry_run:
-                        cursor.execute("UPDATE series SET isfdb_id = ?, updated_at = ? WHERE id = ?",
-                                       (parent_isfdb_id, now, existing_parent_id))
+                        series_updates.append((parent_isfdb_id, None, existing_parent_id))
+                        parent_row[1] = parent_isfdb_id
+                        track(parent_row, parent_name_norm)
                     print(f"  🔗 Updated parent '{parent['series_title']}' with isfdb_id:{parent_isfdb_id}")
                 return existing_parent_id
 
             new_parent_id = str(uuid.uuid4())
             parent_stub_ids[parent_isfdb_id] = new_parent_id
             if not dry_run:
-                cursor.execute("""
-                    INSERT INTO series (id, name, name_normalized, author, author_normalized,
-                        total_books, confidence, verified, isfdb_id, genre, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (new_parent_id, parent['series_title'], parent_name_norm,
-                      primary_author, normalize(primary_author) if primary_author else None,
-                      0, 0.9, 0, parent_isfdb_id, genre, now, now))
+                series_rows.append((
+                    new_parent_id, parent['series_title'], parent_name_norm,
+                    primary_author, normalize(primary_author) if primary_author else None,
+                    0, None, None, 0.9, 0, parent_isfdb_id, genre, None))
+                track([new_parent_id, parent_isfdb_id, None], parent_name_norm)
             print(f"  📁 Created parent series: {parent['series_title']} (isfdb:{parent_isfdb_id})")
             return new_parent_id
 
-        # Check if series already exists
-        cursor.execute("SELECT id, isfdb_id, parent_series_id FROM series WHERE isfdb_id = ? OR name_normalized = ?",
-                       (isfdb_id, normalize(series_name)))
-        existing = cursor.fetchone()
+        # Every write is queued and run with executemany in batches; lookups go
+        # through the in-memory indexes, never back to the DB. Series inserts (new
+        # series and parent stubs, in creation order) are flushed before the UPDATEs,
+        # which may target a series created earlier in the import.
+        series_rows = []
+        series_updates = []  # (isfdb_id, parent_series_id, id), one per changed series
+        book_rows = []
+        source_rows = []
+        pending = (series_rows, series_updates, book_rows, source_rows)
+
+        def flush_rows():
+            cursor.executemany(_INSERT_SERIES_SQL, series_rows)
+            cursor.executemany(_UPDATE_SERIES_LINKS_SQL, series_updates)
+            cursor.executemany(_INSERT_BOOK_SQL, book_rows)
+            cursor.executemany(_INSERT_SOURCE_SQL, source_rows)
+            for rows in pending:
+                rows.clear()
+
+        # One transaction for the whole import — `with db` commits it at the end,
+        # or rolls it back if anything raises
+        cursor.execute("BEGIN")
+
+        for entry in series_data:
+            if any(len(rows) >= WRITE_BATCH_SIZE for rows in pending):
+                flush_rows()
+
+            series_name = entry['series_title']
+            isfdb_id = str(entry['series_id'])
+            books = entry.get('books', [])
+
+            # Determine primary author from books
+            author_counts = Counter(b.author for b in books if b.author)
+            primary_author = author_counts.most_common(1)[0][0] if author_counts else None
+
+            # Check if series already exists
+            series_name_norm = normalize(series_name)
+            existing = by_isfdb.get(isfdb_id) or by_norm.get(series_name_norm)
+
+            if existing:
+                existing_id = existing[0]
+                existing_isfdb = existing[1]
+                existing_parent = existing[2]
+                updates = []
+                set_isfdb = set_parent = None
+
+                if not existing_isfdb:
+                    if not dry_run:
+                        set_isfdb = isfdb_id
+                        existing[1] = isfdb_id
+                        track(existing, series_name_norm)
+                    updates.append(f"isfdb_id:{isfdb_id}")
 
-        if existing:
-            existing_id = existing[0]
-            existing_isfdb = existing[1]
-            existing_parent = existing[2]
-            updates = []
+                parent_ns_id = resolve_parent(entry, primary_author)
+                if parent_ns_id and not existing_parent:
+                    if not dry_run:
+                        set_parent = parent_ns_id
+                        existing[2] = parent_ns_id
+                    parent_name = entry['parent_info']['series_title'] if entry.get('parent_info') else '?'
+                    updates.append(f"parent→{parent_name}")
 
-            if not existing_isfdb:
-                if not dry_run:
-                    cursor.execute("UPDATE series SET isfdb_id = ?, updated_at = ? WHERE id = ?",
-                                   (isfdb_id, now, existing_id))
-                updates.append(f"isfdb_id:{isfdb_id}")
+                if set_isfdb or set_parent:
+                    series_updates.append((set_isfdb, set_parent, existing_id))
 
-            parent_ns_id = resolve_parent(entry)
-            if parent_ns_id and not existing_parent:
-                if not dry_run:
-                    cursor.execute("UPDATE series SET parent_series_id = ?, updated_at = ? WHERE id = ?",
-                                   (parent_ns_id, now, existing_id))
-                parent_name = entry['parent_info']['series_title'] if entry.get('parent_info') else '?'
-                updates.append(f"parent→{parent_name}")
-
-            if updates:
-                print(f"  🔄 Updated '{series_name}' (id: {existing_id}): {', '.join(updates)}")
-                series_updated += 1
-            else:
-                print(f"  ⏭️  Series '{series_name}' already exists (id: {existing_id}), nothing to update")
-            continue
+                if updates:
+                    print(f"  🔄 Updated '{series_name}' (id: {existing_id}): {', '.join(updates)}")
+                    series_updated += 1
+                else:
+                    print(f"  ⏭️  Series '{series_name}' already exists (id: {existing_id}), nothing to update")
+                continue
 
-        # --- New series ---
-        parent_ns_id = resolve_parent(entry)
+            # --- New series ---
+            parent_ns_id = resolve_parent(entry, primary_author)
 
-        years = [b['year'] for b in books if b.get('year')]
-        year_start = min(years) if years else None
-        year_end = max(years) if years else None
+            years = [b.year for b in books if b.year]
+            year_start, year_end = (min(years), max(years)) if years else (None, None)
 
-        series_id = str(uuid.uuid4())
+            series_id = str(uuid.uuid4())
 
-        if not dry_run:
-            cursor.execute("""
-                INSERT INTO series (id, name, name_normalized, author, author_normalized,
-                    total_books, year_start, year_end, confidence, verified,
-                    isfdb_id, genre, created_at, updated_at, parent_series_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (series_id, series_name, normalize(series_name),
-                  primary_author, normalize(primary_author) if primary_author else None,
-                  len(books), year_start, year_end, 0.95, 0,
-                  isfdb_id, genre, now, now, parent_ns_id))
-
-        series_inserted += 1
-        print(f"\n  ✅ Series: {series_name} (isfdb:{isfdb_id}, {len(books)} books, {year_start}-{year_end})")
-        print(f"     Author: {primary_author}")
-
-        for b in books:
-            book_id = str(uuid.uuid4())
-            isbn = b.get('isbn')
+            if not dry_run:
+                series_rows.append((
+                    series_id, series_name, series_name_norm,
+                    primary_author, normalize(primary_author) if primary_author else None,
+                    len(books), year_start, year_end, 0.95, 0,
+                    isfdb_id, genre, parent_ns_id))
+                track([series_id, isfdb_id, parent_ns_id], series_name_norm)
+
+            series_inserted += 1
+            print(f"\n  ✅ Series: {series_name} (isfdb:{isfdb_id}, {len(books)} books, {year_start}-{year_end})")
+            print(f"     Author: {primary_author}")
 
             if not dry_run:
-                cursor.execute("""
-                    INSERT INTO series_book (id, series_id, position, title, title_normalized,
-                        author, year_published, isbn, confidence, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (book_id, series_id, b.get('position'), b['title'], normalize(b['title']),
-                      b.get('author'), b.get('year'), isbn, 0.95, now, now))
-
-            books_inserted += 1
-            pos_str = f"#{b.get('position', '?')}" if b.get('position') is not None else "  "
-            isbn_str = f" ISBN:{isbn}" if isbn else ""
-            print(f"     {pos_str:>5} {b['title']} ({b.get('year', '?')}){isbn_str}")
+                book_rows.extend(
+                    (str(uuid.uuid4()), series_id, b.position, b.title, normalize(b.title),
+                     b.author, b.year, b.isbn, 0.95) for b in books)
+            books_inserted += len(books)
+
+            # One write per series rather than a print() per book
+            log_lines = []
+            for b in books:
+                pos_str = f"#{b.position}" if b.position is not None else "  "
+                isbn_str = f" ISBN:{b.isbn}" if b.isbn else ""
+                log_lines.append(f"     {pos_str:>5} {b.title} ({b.year}){isbn_str}\n")
+            sys.stdout.write(''.join(log_lines))
 
-        if not dry_run:
-            source_id = str(uuid.uuid4())
-            cursor.execute("""
-                INSERT INTO source_data (id, series_id, source, raw_data, book_count, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (source_id, series_id, 'isfdb-dump',
-                  json.dumps(entry, default=str), len(books), now))
-        source_inserted += 1
-
-    if not dry_run:
-        db.commit()
+            if not dry_run:
+                source_id = str(uuid.uuid4())
+                source_rows.append((
+                    source_id, series_id, 'isfdb-dump',
+                    encode_entry(entry), len(books)))
+            source_inserted += 1
 
-    db.close()
+        if not dry_run:
+            flush_rows()
 
     print(f"\n{'=' * 60}")
     print(f"Import complete{'  (DRY RUN)' if dry_run else ''}:")
@@ -840,88 +1183,102 @@ def run_bulk_import(isfdb, target_names, dry_run=False, genre=None):
     if dry_run:
         print("\n🔍 DRY RUN — no database changes will be made\n")
 
-    db = sqlite3.connect(str(NACHOSERIES_DB))
-    cursor = db.cursor()
-    now = datetime.now(tz=timezone.utc).isoformat()
+    with closing(connect_nachoseries(dry_run)) as db, db:
+        if not dry_run:
+            ensure_lookup_indexes(db)
+        cursor = db.cursor()
+
+        updated_isfdb_id = 0
+        updated_parent = 0
+        already_up_to_date = 0
+        parent_stubs_created = 0
+        parent_stub_ids = {}  # isfdb_id -> nachoseries UUID
+        # Writes are queued and run with one executemany each at the end; stubs go
+        # first, since a later series can match (and update) a stub by name
+        stub_rows = []
+        series_updates = []  # (isfdb_id, parent_series_id, id)
+
+        # One transaction for the whole run — `with db` commits it at the end,
+        # or rolls it back if anything raises
+        cursor.execute("BEGIN")
+
+        # Every series row the loop can look up, fetched in one query; see
+        # prefetch_existing_series for how the indexes follow the writes below
+        parent_norms = {str(p['series_id']): normalize(p['series_title']) for p in parents.values()}
+        by_isfdb, by_norm, track = prefetch_existing_series(
+            cursor, parent_norms, [normalize(name) for name in found_series] + list(parent_norms.values()))
 
-    updated_isfdb_id = 0
-    updated_parent = 0
-    already_up_to_date = 0
-    parent_stubs_created = 0
-    parent_stub_ids = {}  # isfdb_id -> nachoseries UUID
+        for name, s in found_series.items():
+            isfdb_id = str(s['series_id'])
+            series_name_norm = normalize(name)
 
-    for name, s in found_series.items():
-        isfdb_id = str(s['series_id'])
-        series_name_norm = normalize(name)
-
-        # Look up in NachoSeries
-        cursor.execute("SELECT id, isfdb_id, parent_series_id FROM series WHERE name_normalized = ?",
-                       (series_name_norm,))
-        existing = cursor.fetchone()
-        if not existing:
-            continue  # Series not in NachoSeries (shouldn't happen with --from-db)
-
-        ns_id = existing[0]
-        ns_isfdb = existing[1]
-        ns_parent = existing[2]
-        updates = []
-
-        # Update isfdb_id if missing
-        if not ns_isfdb:
-            if not dry_run:
-                cursor.execute("UPDATE series SET isfdb_id = ?, updated_at = ? WHERE id = ?",
-                               (isfdb_id, now, ns_id))
-            updates.append(f"isfdb_id:{isfdb_id}")
-            updated_isfdb_id += 1
-
-        # Update parent if ISFDB has one and NachoSeries doesn't
-        if s['series_parent'] and not ns_parent and s['series_parent'] in parents:
-            parent = parents[s['series_parent']]
-            parent_isfdb_id = str(parent['series_id'])
+            # Look up in NachoSeries
+            existing = by_norm.get(series_name_norm)
+            if not existing:
+                continue  # Series not in NachoSeries (shouldn't happen with --from-db)
 
-            # Resolve parent: find or create in NachoSeries
-            parent_ns_id = parent_stub_ids.get(parent_isfdb_id)
-            if not parent_ns_id:
-                cursor.execute("SELECT id FROM series WHERE isfdb_id = ?", (parent_isfdb_id,))
-                prow = cursor.fetchone()
-                if prow:
-                    parent_ns_id = prow[0]
-                else:
-                    pnorm = normalize(parent['series_title'])
-                    cursor.execute("SELECT id, isfdb_id FROM series WHERE name_normalized = ?", (pnorm,))
-                    prow = cursor.fetchone()
+            ns_id = existing[0]
+            ns_isfdb = existing[1]
+            ns_parent = existing[2]
+            updates = []
+            set_isfdb = set_parent = None
+
+            # Update isfdb_id if missing
+            if not ns_isfdb:
+                if not dry_run:
+                    set_isfdb = isfdb_id
+                    existing[1] = isfdb_id
+                    track(existing, series_name_norm)
+                updates.append(f"isfdb_id:{isfdb_id}")
+                updated_isfdb_id += 1
+
+            # Update parent if ISFDB has one and NachoSeries doesn't
+            parent = None if ns_parent else parents.get(s['series_parent'])
+            if parent:
+                parent_isfdb_id = str(parent['series_id'])
+
+                # Resolve parent: find or create in NachoSeries
+                parent_ns_id = parent_stub_ids.get(parent_isfdb_id)
+                if not parent_ns_id:
+                    prow = by_isfdb.get(parent_isfdb_id)
                     if prow:
                         parent_ns_id = prow[0]
-                        if not prow[1] and not dry_run:
-                            cursor.execute("UPDATE series SET isfdb_id = ?, updated_at = ? WHERE id = ?",
-                                           (parent_isfdb_id, now, parent_ns_id))
                     else:
-                        # Create parent stub
-                        parent_ns_id = str(uuid.uuid4())
-                        if not dry_run:
-                            cursor.execute("""
-                                INSERT INTO series (id, name, name_normalized, total_books,
-                                    confidence, verified, isfdb_id, genre, created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (parent_ns_id, parent['series_title'], pnorm,
-                                  0, 0.5, 0, parent_isfdb_id, genre, now, now))
-                        parent_stubs_created += 1
-
-                parent_stub_ids[parent_isfdb_id] = parent_ns_id
-
-            if parent_ns_id and not ns_parent:
+                        pnorm = parent_norms[parent_isfdb_id]
+                        prow = by_norm.get(pnorm)
+                        if prow:
+                            parent_ns_id = prow[0]
+                            if not prow[1] and not dry_run:
+                                series_updates.append((parent_isfdb_id, None, parent_ns_id))
+                                prow[1] = parent_isfdb_id
+                                track(prow, pnorm)
+                        else:
+                            # Create parent stub
+                            parent_ns_id = str(uuid.uuid4())
+                            if not dry_run:
+                                stub_rows.append((
+                                    parent_ns_id, parent['series_title'], pnorm, None, None,
+                                    0, None, None, 0.5, 0, parent_isfdb_id, genre, None))
+                                track([parent_ns_id, parent_isfdb_id, None], pnorm)
+                            parent_stubs_created += 1
+
+                    parent_stub_ids[parent_isfdb_id] = parent_ns_id
+
                 if not dry_run:
-                    cursor.execute("UPDATE series SET parent_series_id = ?, updated_at = ? WHERE id = ?",
-                                   (parent_ns_id, now, ns_id))
+                    set_parent = parent_ns_id
+                    existing[2] = parent_ns_id
                 updates.append(f"parent→{parent['series_title']}")
                 updated_parent += 1
 
-        if not updates:
-            already_up_to_date += 1
+            if set_isfdb or set_parent:
+                series_updates.append((set_isfdb, set_parent, ns_id))
 
-    if not dry_run:
-        db.commit()
-    db.close()
+            if not updates:
+                already_up_to_date += 1
+
+        if not dry_run:
+            cursor.executemany(_INSERT_SERIES_SQL, stub_rows)
+            cursor.executemany(_UPDATE_SERIES_LINKS_SQL, series_updates)
 
     print(f"\n{'=' * 60}")
     print(f"Bulk Import Complete{'  (DRY RUN)' if dry_run else ''}:")
@@ -936,6 +1293,9 @@ def run_bulk_import(isfdb, target_names, dry_run=False, genre=None):
 def run_import(isfdb, target_names, dry_run=False, genre=None, merge_children=False):
     """Main import orchestration — works with either ISFDBSqlite or ISFDBDump backend."""
 
+    # Lets the dump backend read series and titles in a single pass
+    isfdb.prefetch_titles(target_names)
+
     # Step 1: Find series IDs
     found_series = isfdb.find_series_ids(target_names)
 
@@ -963,14 +1323,15 @@ def run_import(isfdb, target_names, dry_run=False, genre=None, merge_children=Fa
     all_series_ids = {s['series_id'] for s in found_series.values()}
     found_ids = set(all_series_ids)
 
+    # series_id -> target name (first name wins if several resolve to one series)
+    found_by_id = {}
+    for name, s in found_series.items():
+        found_by_id.setdefault(s['series_id'], name)
+
     search_for_children_of = all_series_ids | parent_ids
     sub_series = isfdb.find_sub_series(search_for_children_of)
     for parent_id, children in sub_series.items():
-        parent_name = None
-        for name, s in found_series.items():
-            if s['series_id'] == parent_id:
-                parent_name = name
-                break
+        parent_name = found_by_id.get(parent_id)
         if parent_name is None and parent_id in parents:
             parent_name = parents[parent_id]['series_title']
 
@@ -981,7 +1342,7 @@ def run_import(isfdb, target_names, dry_run=False, genre=None, merge_children=Fa
                     print(f"     └─ {child['series_title']} (ID: {child['series_id']}) [already a target]")
                 else:
                     print(f"     └─ {child['series_title']} (ID: {child['series_id']})")
-                all_series_ids.add(child['series_id'])
+            all_series_ids.update(c['series_id'] for c in children)
 
     # Track direct children of target series for merging
     merged_series_ids = set()
@@ -998,163 +1359,123 @@ def run_import(isfdb, target_names, dry_run=False, genre=None, merge_children=Fa
     total_titles = sum(len(v) for v in titles.values())
     print(f"   Found {total_titles} titles across {len(titles)} series")
 
+    # Steps 5 and 6 only depend on title_ids; start the pub lookup now so it
+    # runs alongside the author lookup
+    isfdb.prefetch_pubs(title_ids)
+
     # Step 5: Find authors
-    title_to_author, author_ids = isfdb.find_authors_for_titles(title_ids)
-    author_names = isfdb.find_author_names(author_ids)
-    print(f"   Found {len(author_names)} unique authors")
+    title_authors = isfdb.find_authors_by_title(title_ids)
 
     # Step 6: Find publications (ISBNs, covers)
     title_pub_info = isfdb.find_pubs_for_titles(title_ids)
     print(f"   Found publication info for {len(title_pub_info)} titles")
 
     # Step 7: Assemble final data
-    series_data = []
+    # Bound once here; build_book runs for every title
+    author_of = title_authors.get
+    pub_of = title_pub_info.get
+
+    def build_book(t, position):
+        tid = t['title_id']
+        author_name = author_of(tid, 'Unknown')
+        pub = pub_of(tid)
+        if pub:
+            isbn, cover_url, pages = pub.get('pub_isbn'), pub.get('pub_frontimage'), pub.get('pub_pages')
+        else:
+            isbn = cover_url = pages = None
 
-    for name, s in found_series.items():
-        sid = s['series_id']
-        series_titles = titles.get(sid, [])
-
-        books = []
-        for t in series_titles:
-            tid = t['title_id']
-            author_id = title_to_author.get(tid)
-            author_name = author_names.get(author_id, 'Unknown') if author_id else 'Unknown'
-            pub = title_pub_info.get(tid, {})
-
-            books.append({
-                'title': t['title'],
-                'position': t['seriesnum'],
-                'author': author_name,
-                'year': extract_year(t['copyright']),
-                'isbn': pub.get('pub_isbn'),
-                'cover_url': pub.get('pub_frontimage'),
-                'pages': pub.get('pub_pages'),
-                'isfdb_title_id': tid,
-            })
+        return Book(t['title'], position, author_name, extract_year(t['copyright']),
+                    isbn, cover_url, pages, tid)
 
-        def sort_key(b):
-            pos = b['position']
-            try:
-                pos = float(pos) if pos is not None else 999
-            except (ValueError, TypeError):
-                pos = 999
-            yr = b.get('year') or 9999
-            return (pos, yr)
-        books.sort(key=sort_key)
-
-        # Merge children's books if requested
-        if merge_children and sid in sub_series:
-            children_to_merge = [c for c in sub_series[sid] if c['series_id'] in merged_series_ids]
-            if children_to_merge:
-                # Find max position from parent books
-                max_pos = 0
-                for b in books:
-                    try:
-                        p = float(b['position']) if b['position'] is not None else 0
-                        max_pos = max(max_pos, p)
-                    except (ValueError, TypeError):
-                        pass
-
-                for child in children_to_merge:
-                    child_sid = child['series_id']
-                    child_titles = titles.get(child_sid, [])
-                    print(f"     🔀 Merging {len(child_titles)} books from '{child['series_title']}' (positions offset by {int(max_pos)})")
-
-                    for t in child_titles:
-                        tid = t['title_id']
-                        author_id = title_to_author.get(tid)
-                        author_name = author_names.get(author_id, 'Unknown') if author_id else 'Unknown'
-                        pub = title_pub_info.get(tid, {})
-
-                        # Offset position by parent's max
-                        pos = t['seriesnum']
-                        if pos is not None:
-                            try:
-                                pos = float(pos) + max_pos
-                            except (ValueError, TypeError):
-                                pass
-
-                        books.append({
-                            'title': t['title'],
-                            'position': pos,
-                            'author': author_name,
-                            'year': extract_year(t['copyright']),
-                            'isbn': pub.get('pub_isbn'),
-                            'cover_url': pub.get('pub_frontimage'),
-                            'pages': pub.get('pub_pages'),
-                            'isfdb_title_id': tid,
-                        })
-
-                # Re-sort after merge
-                books.sort(key=sort_key)
-
-        entry = {
-            'series_id': s['series_id'],
-            'series_title': s['series_title'],
-            'books': books,
-        }
+    def build_books(sid):
+        books = [build_book(t, t['seriesnum']) for t in titles.get(sid, [])]
+        books.sort(key=attrgetter('sort_key'))
+        return books
 
-        if s['series_parent'] and s['series_parent'] in parents:
-            entry['parent_info'] = parents[s['series_parent']]
+    # Entries are yielded one at a time as import_to_nachoseries consumes them,
+    # so only one series' books are held in memory at once
+    def iter_series_entries():
+        for name, s in found_series.items():
+            sid = s['series_id']
+            books = [build_book(t, t['seriesnum']) for t in titles.get(sid, [])]
+
+            # Merge children's books if requested
+            if merge_children and sid in sub_series:
+                children_to_merge = [c for c in sub_series[sid] if c['series_id'] in merged_series_ids]
+                if children_to_merge:
+                    # Find max position from parent books
+                    max_pos = 0
+                    for b in books:
+                        try:
+                            p = float(b.position) if b.position is not None else 0
+                            max_pos = max(max_pos, p)
+                        except (ValueError, TypeError):
+                            pass
+
+                    for child in children_to_merge:
+                        child_sid = child['series_id']
+                        child_titles = titles.get(child_sid, [])
+                        print(f"     🔀 Merging {len(child_titles)} books from '{child['series_title']}' (positions offset by {int(max_pos)})")
+
+                        for t in child_titles:
+                            # Offset position by parent's max
+                            pos = t['seriesnum']
+                            if pos is not None:
+                                try:
+                                    pos = float(pos) + max_pos
+                                except (ValueError, TypeError):
+                                    pass
+
+                            books.append(build_book(t, pos))
+
+            # Sorted once, after any merged children are in. list.sort is stable, so
+            # this matches sorting the parent's books first and re-sorting after merge.
+            books.sort(key=attrgetter('sort_key'))
 
-        series_data.append(entry)
+            entry = {
+                'series_id': s['series_id'],
+                'series_title': s['series_title'],
+                'books': books,
+            }
 
-    # Also add sub-series entries
-    for parent_id, children in sub_series.items():
-        for child in children:
-            csid = child['series_id']
-            if csid in found_ids:
-                continue
-            if csid in merged_series_ids:
-                continue  # Already merged into parent series
-
-            child_titles = titles.get(csid, [])
-            books = []
-            for t in child_titles:
-                tid = t['title_id']
-                author_id = title_to_author.get(tid)
-                author_name = author_names.get(author_id, 'Unknown') if author_id else 'Unknown'
-                pub = title_pub_info.get(tid, {})
-
-                books.append({
-                    'title': t['title'],
-                    'position': t['seriesnum'],
-                    'author': author_name,
-                    'year': extract_year(t['copyright']),
-                    'isbn': pub.get('pub_isbn'),
-                    'cover_url': pub.get('pub_frontimage'),
-                    'pages': pub.get('pub_pages'),
-                    'isfdb_title_id': tid,
-                })
+            if s['series_parent'] and s['series_parent'] in parents:
+                entry['parent_info'] = parents[s['series_parent']]
 
-            def sort_key_sub(b):
-                pos = b['position']
-                try:
-                    pos = float(pos) if pos is not None else 999
-                except (ValueError, TypeError):
-                    pos = 999
-                yr = b.get('year') or 9999
-                return (pos, yr)
-            books.sort(key=sort_key_sub)
+            yield entry
 
+        # Also add sub-series entries, skipping children that are targets themselves
+        # or were merged into their parent above
+        skip_ids = found_ids | merged_series_ids
+        for parent_id, children in sub_series.items():
             parent_info = None
-            for name, s in found_series.items():
-                if s['series_id'] == parent_id:
-                    parent_info = {'series_id': parent_id, 'series_title': s['series_title']}
-                    break
-            if parent_info is None and parent_id in parents:
+            if parent_id in found_by_id:
+                parent_info = {'series_id': parent_id,
+                               'series_title': found_series[found_by_id[parent_id]]['series_title']}
+            elif parent_id in parents:
                 parent_info = {'series_id': parent_id, 'series_title': parents[parent_id]['series_title']}
 
-            entry = {
-                'series_id': child['series_id'],
-                'series_title': child['series_title'],
-                'books': books,
-                'parent_info': parent_info,
-            }
-            series_data.append(entry)
+            for child in children:
+                csid = child['series_id']
+                if csid in skip_ids:
+                    continue
+
+                entry = {
+                    'series_id': child['series_id'],
+                    'series_title': child['series_title'],
+                    'books': build_books(csid),
+                    'parent_info': parent_info,
+                }
+                yield entry
+
+    # Every series an entry or its parent_info can name, for the import's prefetch
+    lookup_series = [(s['series_id'], s['series_title']) for s in found_series.values()]
+    lookup_series += [(p['series_id'], p['series_title']) for p in parents.values()]
+    lookup_series += [(c['series_id'], c['series_title'])
+                      for children in sub_series.values() for c in children]
 
     # Step 8: Import
-    import_to_nachoseries(series_data, dry_run=dry_run, genre=genre)
+    import_to_nachoseries(iter_series_entries(), dry_run=dry_run, genre=genre,
+                          lookup_series=lookup_series)
 
 
 def main():
@@ -1162,23 +1483,24 @@ def main():
         print(__doc__)
         sys.exit(1)
 
-    dump_path = sys.argv[1]
-    target_names = sys.argv[2:]
-    dry_run = '--dry-run' in target_names
-    if dry_run:
-        target_names.remove('--dry-run')
-
-    genre = None
-    merge_children = '--merge-children' in target_names
-    if merge_children:
-        target_names.remove('--merge-children')
-    from_db = '--from-db' in target_names
-    if from_db:
-        target_names.remove('--from-db')
-    for arg in list(target_names):
-        if arg.startswith('--genre='):
-            genre = arg.split('=', 1)[1]
-            target_names.remove(arg)
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False)
+    parser.add_argument('dump_path')
+    parser.add_argument('target_names', nargs='*')
+    parser.add_argument('--genre')
+    parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--merge-children', action='store_true')
+    parser.add_argument('--from-db', action='store_true')
+    # Flags may appear anywhere among the series names
+    args = parser.parse_intermixed_args()
+
+    dump_path = args.dump_path
+    target_names = args.target_names
+    dry_run = args.dry_run
+    genre = args.genre
+    merge_children = args.merge_children
+    from_db = args.from_db
 
     if not Path(dump_path).exists():
         print(f"Error: Source file not found: {dump_path}")
@@ -1196,11 +1518,10 @@ def main():
         if genre:
             genre_filter = 'WHERE genre = ?'
             params = [genre]
-        rows = ns_db.execute(
+        target_names = [name for (name,) in ns_db.execute(
             f"SELECT name FROM series {genre_filter} ORDER BY name", params
-        ).fetchall()
+        )]
         ns_db.close()
-        target_names = [row[0] for row in rows]
         print(f"📋 Loaded {len(target_names)} series names from NachoSeries DB")
         if genre:
             print(f"   Filtered by genre: {genre}")
@@ -1212,14 +1533,7 @@ def main():
         sys.exit(1)
 
     # Auto-detect: SQLite DB vs raw MySQL dump
-    is_sqlite = dump_path.endswith('.db') or dump_path.endswith('.sqlite')
-    if not is_sqlite:
-        with open(dump_path, 'rb') as f:
-            header = f.read(16)
-            if header.startswith(b'SQLite format 3'):
-                is_sqlite = True
-
-    if is_sqlite:
+    if is_sqlite_db(dump_path):
         print(f"ISFDB Source: {dump_path} (SQLite — fast mode)")
         isfdb = ISFDBSqlite(dump_path)
     else:
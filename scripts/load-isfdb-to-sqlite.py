@@ -15,19 +15,24 @@ Example:
     python3 scripts/load-isfdb-to-sqlite.py \
         /tmp/isfdb-backup/cygdrive/c/ISFDB/Backups/backup-MySQL-55-2026-02-14
 
-Tables loaded (only what import-isfdb-dump.py needs):
+Tables loaded (only the tables and columns import-isfdb-dump.py reads):
     series, titles, canonical_author, authors, pub_content, pubs
 """
 
+import os
 import sys
 import re
+import mmap
 import sqlite3
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 DEFAULT_OUTPUT = "/tmp/isfdb.db"
 
-# Tables we need and their CREATE statements (simplified from MySQL schema)
+# Tables we need and their CREATE statements (simplified from MySQL schema).
+# Only the columns import-isfdb-dump.py reads are kept; see TABLE_COLUMNS.
 TABLES = {
     'series': """
         CREATE TABLE IF NOT EXISTS series (
@@ -43,82 +48,45 @@ TABLES = {
         CREATE TABLE IF NOT EXISTS titles (
             title_id        INTEGER PRIMARY KEY,
             title_title     TEXT,
-            title_translator INTEGER,
-            title_synopsis  INTEGER,
-            note_id         INTEGER,
             series_id       INTEGER,
             title_seriesnum TEXT,
             title_copyright TEXT,
-            title_storylen  TEXT,
             title_ttype     TEXT,
-            title_wikipedia TEXT,
-            title_views     INTEGER,
             title_parent    INTEGER,
-            title_rating    REAL,
-            title_annualviews INTEGER,
-            title_ctl       INTEGER,
-            title_language  INTEGER,
-            title_seriesnum_2 TEXT,
-            title_non_genre TEXT,
-            title_graphic   TEXT,
-            title_nvz       TEXT,
-            title_jvn       TEXT,
-            title_content   INTEGER
+            title_language  INTEGER
         )
     """,
     'canonical_author': """
         CREATE TABLE IF NOT EXISTS canonical_author (
             ca_id     INTEGER PRIMARY KEY,
             title_id  INTEGER,
-            author_id INTEGER,
-            ca_status INTEGER
+            author_id INTEGER
         )
     """,
     'authors': """
         CREATE TABLE IF NOT EXISTS authors (
             author_id        INTEGER PRIMARY KEY,
-            author_canonical TEXT,
-            author_legalname TEXT,
-            author_birthplace TEXT,
-            author_birthdate  TEXT,
-            author_deathdate  TEXT,
-            note_id           INTEGER,
-            author_wikipedia  TEXT,
-            author_views      INTEGER,
-            author_imdb       TEXT,
-            author_marque     TEXT,
-            author_image      TEXT,
-            author_annualviews INTEGER,
-            author_lastname   TEXT,
-            author_language   INTEGER,
-            author_note       INTEGER
+            author_canonical TEXT
         )
     """,
     'pub_content': """
         CREATE TABLE IF NOT EXISTS pub_content (
             pubc_id   INTEGER PRIMARY KEY,
             title_id  INTEGER,
-            pub_id    INTEGER,
-            pubc_page TEXT
+            pub_id    INTEGER
         )
     """,
     'pubs': """
         CREATE TABLE IF NOT EXISTS pubs (
             pub_id       INTEGER PRIMARY KEY,
             pub_title    TEXT,
-            pub_tag      TEXT,
             pub_year     TEXT,
-            publisher_id INTEGER,
             pub_pages    TEXT,
             pub_ptype    TEXT,
             pub_ctype    TEXT,
             pub_isbn     TEXT,
             pub_frontimage TEXT,
-            pub_price    TEXT,
-            note_id      INTEGER,
-            pub_series_id INTEGER,
-            pub_series_num TEXT,
-            pub_catalog  TEXT
+            pub_price    TEXT
         )
     """,
 }
@@ -126,8 +94,11 @@ TABLES = {
 # Indexes to create after loading (speeds up import-isfdb-dump.py queries)
 INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_series_title ON series(series_title)",
+    # find_series_ids matches on LOWER(series_title)
+    "CREATE INDEX IF NOT EXISTS idx_series_title_lower ON series(LOWER(series_title))",
     "CREATE INDEX IF NOT EXISTS idx_series_parent ON series(series_parent)",
-    "CREATE INDEX IF NOT EXISTS idx_titles_series_id ON titles(series_id)",
+    # Covers find_titles_for_series' type/language/parent filters
+    "CREATE INDEX IF NOT EXISTS idx_titles_series ON titles(series_id, title_ttype, title_language, title_parent)",
     "CREATE INDEX IF NOT EXISTS idx_titles_ttype ON titles(title_ttype)",
     "CREATE INDEX IF NOT EXISTS idx_titles_parent ON titles(title_parent)",
     "CREATE INDEX IF NOT EXISTS idx_ca_title_id ON canonical_author(title_id)",
@@ -136,16 +107,49 @@ INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_pc_pub_id ON pub_content(pub_id)",
 ]
 
-# Column counts per table (for validation)
-TABLE_COL_COUNTS = {
-    'series': 6,
-    'titles': 23,
-    'canonical_author': 4,
-    'authors': 16,
-    'pub_content': 4,
-    'pubs': 15,
+# Rows per transaction: the load runs inside explicit BEGIN/COMMIT blocks of this
+# size, so dirty pages are written out once per block rather than per statement
+COMMIT_EVERY_ROWS = 100_000
+
+# Progress is reported each time this much more of the dump has been scanned
+REPORT_EVERY_BYTES = 512 * 1024 * 1024
+
+# INSERT lines are parsed in worker processes, one core being left for the
+# SQLite writer (on a single core they are parsed inline); at most PARSE_WINDOW
+# parsed lines wait to be written at any time
+PARSE_WORKERS = (os.cpu_count() or 1) - 1
+PARSE_WINDOW = PARSE_WORKERS * 4
+
+# Positions (in the dump's column order) of the columns each table keeps
+TABLE_COLUMNS = {
+    'series': (0, 1, 2, 3, 4, 5),
+    'titles': (0, 1, 5, 6, 7, 9, 12, 16),
+    'canonical_author': (0, 1, 2),
+    'authors': (0, 1),
+    'pub_content': (0, 1, 2),
+    'pubs': (0, 1, 3, 5, 6, 7, 8, 9, 10),
 }
 
+# INSERT statements per table, built once so every batch reuses the same SQL
+# string (and so the same prepared statement from sqlite3's cache)
+INSERT_SQL = {t: f"INSERT INTO {t} VALUES ({','.join(['?'] * len(cols))})"
+              for t, cols in TABLE_COLUMNS.items()}
+INSERT_OR_IGNORE_SQL = {t: f"INSERT OR IGNORE INTO {t} VALUES ({','.join(['?'] * len(cols))})"
+                        for t, cols in TABLE_COLUMNS.items()}
+
+
+# Backslash escapes inside quoted MySQL strings (mysqldump writes \0 \' \" \\ \n \r \Z),
+# undone in a single pass. As in MySQL, a backslash before a character with no
+# special meaning just drops out, except in \% and \_, which keep it.
+_ESC_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESC_MAP = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a",
+            "%": "\\%", "_": "\\_"}
+
+
+def _unescape(m):
+    c = m.group(1)
+    return _ESC_MAP.get(c, c)
+
 
 def parse_mysql_value(val_str):
     """Parse a MySQL value from an INSERT statement."""
@@ -154,11 +158,8 @@ def parse_mysql_value(val_str):
         return None
     if val_str.startswith("'") and val_str.endswith("'"):
         inner = val_str[1:-1]
-        inner = inner.replace("\\'", "'")
-        inner = inner.replace("\\\\", "\\")
-        inner = inner.replace("\\n", "\n")
-        inner = inner.replace("\\r", "\r")
-        inner = inner.replace("\\t", "\t")
+        if '\\' in inner:
+            inner = _ESC_RE.sub(_unescape, inner)
         return inner
     try:
         if '.' in val_str:
@@ -168,9 +169,55 @@ def parse_mysql_value(val_str):
         return val_str
 
 
-def parse_mysql_tuples(line):
-    """Parse MySQL INSERT VALUES into list of tuples."""
-    values_match = re.search(r'VALUES\s+', line, re.IGNORECASE)
+def parse_mysql_int(val_str):
+    """parse_mysql_value for an INTEGER column: NULL and plain integers are
+    handled directly, anything else falls through to parse_mysql_value."""
+    if val_str == 'NULL':
+        return None
+    try:
+        return int(val_str)
+    except ValueError:
+        return parse_mysql_value(val_str)
+
+
+def _column_parsers():
+    """Per table, (dump position, parser) for each kept column, typed by the
+    column types SQLite reads back from the DDL. Raises ValueError if a table's
+    column count doesn't match its TABLE_COLUMNS entry or a type is unknown, so
+    a DDL edit can't silently hand a column the wrong parser."""
+    parsers = {'INTEGER': parse_mysql_int, 'TEXT': parse_mysql_value, 'REAL': parse_mysql_value}
+    db = sqlite3.connect(':memory:')
+    try:
+        result = {}
+        for t, ddl in TABLES.items():
+            db.execute(ddl)
+            types = [ctype for _, _, ctype, *_ in db.execute(f"PRAGMA table_info({t})")]
+            if len(types) != len(TABLE_COLUMNS[t]) or not set(types) <= parsers.keys():
+                raise ValueError(f"{t}: DDL column types {types} don't match "
+                                 f"TABLE_COLUMNS positions {TABLE_COLUMNS[t]}")
+            result[t] = tuple((pos, parsers[ctype]) for pos, ctype in zip(TABLE_COLUMNS[t], types))
+        return result
+    finally:
+        db.close()
+
+
+COLUMN_PARSERS = _column_parsers()
+
+
+_VALUES_RE = re.compile(r'VALUES\s+', re.IGNORECASE)
+
+# One value inside a tuple: bare text and quoted strings up to the next unquoted
+# ',' or ')'. Written as an unrolled loop so a truncated line fails in linear time.
+_MYSQL_VALUE_RE = re.compile(
+    r"([^,)']*(?:'[^'\\]*(?:\\.[^'\\]*)*'[^,)']*)*)([,)])", re.DOTALL)
+
+
+def parse_mysql_tuples(line, columns=None):
+    """Parse MySQL INSERT VALUES into list of tuples.
+    If `columns` ((position, parser) pairs) is given, each tuple is decoded to
+    just those positions, in that order; the rest are never parsed, and a
+    position past the end of a short tuple comes out as None."""
+    values_match = _VALUES_RE.search(line)
     if not values_match:
         return []
 
@@ -178,71 +225,100 @@ def parse_mysql_tuples(line):
     data = data.rstrip().rstrip(';').rstrip()
 
     tuples = []
-    i = 0
-    while i < len(data):
-        if data[i] == '(':
-            i += 1
-            values = []
-            current = ''
-            in_string = False
-            escape_next = False
-
-            while i < len(data):
-                ch = data[i]
-
-                if escape_next:
-                    current += ch
-                    escape_next = False
-                    i += 1
-                    continue
-
-                if ch == '\\' and in_string:
-                    current += ch
-                    escape_next = True
-                    i += 1
-                    continue
-
-                if ch == "'" and not escape_next:
-                    if in_string:
-                        in_string = False
-                        current += ch
-                    else:
-                        in_string = True
-                        current += ch
-                    i += 1
-                    continue
-
-                if in_string:
-                    current += ch
-                    i += 1
-                    continue
-
-                if ch == ',':
-                    values.append(parse_mysql_value(current))
-                    current = ''
-                    i += 1
-                    continue
-                elif ch == ')':
-                    values.append(parse_mysql_value(current))
-                    tuples.append(values)
-                    i += 1
-                    break
-                else:
-                    current += ch
-                    i += 1
-                    continue
+    match_value = _MYSQL_VALUE_RE.match
+    pos = data.find('(')
+    while pos != -1:
+        raw = []
+        pos += 1
+        while True:
+            m = match_value(data, pos)
+            if not m:
+                return tuples  # Truncated tuple — drop it
+            raw.append(m.group(1))
+            pos = m.end()
+            if m.group(2) == ')':
+                break
+        if columns is None:
+            tuples.append([parse_mysql_value(v) for v in raw])
         else:
-            i += 1
+            n = len(raw)
+            tuples.append([parse(raw[i]) if i < n else None for i, parse in columns])
+        pos = data.find('(', pos)
 
     return tuples
 
 
-def detect_table(line):
-    """Detect which table an INSERT INTO line targets. Returns table name or None."""
-    m = re.match(r"INSERT INTO\s+`(\w+)`", line)
-    if m:
-        return m.group(1)
-    return None
+INSERT_PREFIX = b'INSERT INTO `'
+
+
+def iter_insert_spans(dump_path, tables):
+    """Yield (table, start, end) byte offsets for each INSERT line in the dump
+    whose table is in `tables`. The dump is memory-mapped and line starts are
+    found with mmap.find(), so everything else, including other tables' INSERTs,
+    is skipped without being read."""
+    with open(dump_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            find = mm.find
+            needle = b'\n' + INSERT_PREFIX
+            name_start = len(INSERT_PREFIX)
+
+            def line_after(pos):
+                nl = find(needle, pos)
+                return nl + 1 if nl >= 0 else -1
+
+            start = 0 if mm[:name_start] == INSERT_PREFIX else line_after(0)
+            while start >= 0:
+                name_end = find(b'`', start + name_start)
+                if name_end < 0:
+                    return
+                table = mm[start + name_start:name_end].decode('latin1')
+                end = find(b'\n', name_end) + 1 or len(mm)
+                if table in tables:
+                    yield table, start, end
+                start = line_after(end - 1)
+
+
+_parser_mm = None  # each parse worker's own mapping of the dump
+
+
+def _init_parser(dump_path):
+    global _parser_mm
+    with open(dump_path, 'rb') as f:
+        _parser_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def parse_insert_span(span):
+    """Parse one INSERT line (a span from iter_insert_spans) into rows of the
+    table's kept columns. Runs in a parse worker."""
+    table, start, end = span
+    return parse_mysql_tuples(_parser_mm[start:end].decode('latin1'), COLUMN_PARSERS[table])
+
+
+def parse_in_order(dump_path, spans):
+    """Parse spans on the worker pool, yielding (table, rows, end) in dump order,
+    so rows are inserted exactly as a single-process load would insert them."""
+    if PARSE_WORKERS < 1:
+        for span in spans:
+            if _parser_mm is None:
+                _init_parser(dump_path)
+            yield span[0], parse_insert_span(span), span[2]
+        return
+
+    with ProcessPoolExecutor(PARSE_WORKERS, initializer=_init_parser,
+                             initargs=(dump_path,)) as pool:
+        pending = deque()
+        for span in spans:
+            pending.append((span, pool.submit(parse_insert_span, span)))
+            if len(pending) >= PARSE_WINDOW:
+                (table, _, end), future = pending.popleft()
+                yield table, future.result(), end
+        while pending:
+            (table, _, end), future = pending.popleft()
+            yield table, future.result(), end
 
 
 def load_dump(dump_path, output_path):
@@ -255,9 +331,16 @@ def load_dump(dump_path, output_path):
         out.unlink()
 
     db = sqlite3.connect(output_path)
-    db.execute("PRAGMA journal_mode=WAL")
+    # The DB is rebuilt from scratch on every run, so there is nothing a journal
+    # could usefully roll back to: skip it, and hold the file lock throughout
+    db.execute("PRAGMA journal_mode=OFF")
     db.execute("PRAGMA synchronous=OFF")
+    db.execute("PRAGMA locking_mode=EXCLUSIVE")
+    db.execute("PRAGMA temp_store=MEMORY")  # index builds sort in memory
     db.execute("PRAGMA cache_size=-200000")  # 200MB cache
+    # CREATE INDEX is a write, so index builds cannot overlap across
+    # connections; instead let each build's sort use helper threads
+    db.execute(f"PRAGMA threads={os.cpu_count() or 1}")
     cursor = db.cursor()
 
     # Create tables
@@ -267,67 +350,52 @@ def load_dump(dump_path, output_path):
 
     target_tables = set(TABLES.keys())
     row_counts = {t: 0 for t in target_tables}
-    lines_scanned = 0
+    uncommitted_rows = 0
 
     print(f"📂 Loading ISFDB dump: {dump_path}")
     print(f"📦 Output: {output_path}")
     print(f"📋 Tables: {', '.join(sorted(target_tables))}")
     print()
 
-    with open(dump_path, 'r', encoding='latin1') as f:
-        for line in f:
-            lines_scanned += 1
-
-            if lines_scanned % 500000 == 0:
-                elapsed = time.time() - start_time
-                total_rows = sum(row_counts.values())
-                print(f"  ... {lines_scanned:,} lines scanned, {total_rows:,} rows loaded ({elapsed:.0f}s)")
-
-            if not line.startswith('INSERT INTO'):
-                continue
-
-            table = detect_table(line)
-            if table not in target_tables:
-                continue
-
-            tuples = parse_mysql_tuples(line)
-            expected_cols = TABLE_COL_COUNTS[table]
-            placeholders = ','.join(['?'] * expected_cols)
-
-            batch = []
-            for t in tuples:
-                # Pad or truncate to expected column count
-                if len(t) < expected_cols:
-                    t.extend([None] * (expected_cols - len(t)))
-                elif len(t) > expected_cols:
-                    t = t[:expected_cols]
-                batch.append(t)
-
-            if batch:
+    cursor.execute("BEGIN")
+    next_report = REPORT_EVERY_BYTES
+    spans = iter_insert_spans(dump_path, target_tables)
+    for table, batch, end in parse_in_order(dump_path, spans):
+        if end >= next_report:
+            elapsed = time.time() - start_time
+            total_rows = sum(row_counts.values())
+            print(f"  ... {end / 1024 / 1024:,.0f} MB scanned, {total_rows:,} rows loaded ({elapsed:.0f}s)")
+            next_report = end + REPORT_EVERY_BYTES
+
+        if batch:
+            try:
+                # The tables start empty and dump keys are unique, so a plain
+                # INSERT skips OR IGNORE's conflict handling for every row
                 try:
-                    cursor.executemany(
-                        f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})",
-                        batch
-                    )
-                    row_counts[table] += len(batch)
-                except Exception as e:
-                    print(f"  ⚠️  Error inserting into {table}: {e}")
-                    # Try row by row
-                    for row in batch:
-                        try:
-                            cursor.execute(
-                                f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})",
-                                row
-                            )
-                            row_counts[table] += 1
-                        except Exception:
-                            pass
-
-            # Commit periodically
-            if lines_scanned % 100000 == 0:
-                db.commit()
-
-    db.commit()
+                    cursor.executemany(INSERT_SQL[table], batch)
+                except sqlite3.IntegrityError:
+                    # A key was already loaded: redo the batch keeping the first row per key
+                    cursor.executemany(INSERT_OR_IGNORE_SQL[table], batch)
+                row_counts[table] += len(batch)
+                uncommitted_rows += len(batch)
+            except Exception as e:
+                print(f"  ⚠️  Error inserting into {table}: {e}")
+                # Try row by row
+                for row in batch:
+                    try:
+                        cursor.execute(INSERT_OR_IGNORE_SQL[table], row)
+                        row_counts[table] += 1
+                        uncommitted_rows += 1
+                    except Exception:
+                        pass
+
+        # Commit periodically
+        if uncommitted_rows >= COMMIT_EVERY_ROWS:
+            cursor.execute("COMMIT")
+            cursor.execute("BEGIN")
+            uncommitted_rows = 0
+
+    cursor.execute("COMMIT")
 
     # Create indexes
     print("\n🔧 Creating indexes...")
@@ -335,6 +403,17 @@ def load_dump(dump_path, output_path):
         cursor.execute(idx_sql)
     db.commit()
 
+    # Give the importer's planner real statistics, then write a densely packed
+    # copy and swap it in (peak disk use briefly doubles while both files exist)
+    print("📦 Analyzing and compacting...")
+    cursor.execute("ANALYZE")
+    packed = out.with_name(out.name + '.packed')
+    if packed.exists():
+        packed.unlink()
+    cursor.execute("VACUUM INTO ?", (str(packed),))
+    db.close()
+    os.replace(packed, out)
+
     elapsed = time.time() - start_time
 
     print(f"\n{'=' * 60}")
@@ -347,8 +426,6 @@ def load_dump(dump_path, output_path):
     print(f"     {'TOTAL':20s} {sum(row_counts.values()):>10,}")
     print(f"{'=' * 60}")
 
-    db.close()
-
 
 def main():
     if len(sys.argv) < 2:
@@ -114,6 +114,7 @@ CREATE TABLE IF NOT EXISTS crawl_log (
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_series_name ON series(name_normalized);
+CREATE INDEX IF NOT EXISTS idx_series_isfdb ON series(isfdb_id);
 CREATE INDEX IF NOT EXISTS idx_series_author ON series(author_normalized);
 CREATE INDEX IF NOT EXISTS idx_series_genre ON series(genre);
 CREATE INDEX IF NOT EXISTS idx_series_confidence ON series(confidence);